@@ -0,0 +1,120 @@
+import os
+import threading
+import time
+from functools import wraps
+
+from flask import request, jsonify
+
+# Clients can send the time they are still willing to wait (in milliseconds)
+# so that requests they have already given up on never reach the model.
+DEADLINE_HEADER = 'X-Request-Deadline-Ms'
+
+
+class AdmissionController:
+    """
+    Bounds how many requests may run inference at once and how many may wait
+    for a slot. Requests beyond that are rejected straight away with a 503,
+    and requests whose deadline passes before they get a slot are dropped
+    with a 504 instead of piling up behind the model.
+    """
+
+    def __init__(self, max_concurrency=1, max_queue=8, queue_timeout=10.0, retry_after=1):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._in_flight = 0
+        self._admitted = 0
+        self._shed = {'queue_full': 0, 'queue_timeout': 0, 'deadline_expired': 0}
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            max_concurrency=int(os.environ.get('INFERENCE_MAX_CONCURRENCY', 1)),
+            max_queue=int(os.environ.get('INFERENCE_MAX_QUEUE', 8)),
+            queue_timeout=float(os.environ.get('INFERENCE_QUEUE_TIMEOUT', 10)),
+            retry_after=int(os.environ.get('INFERENCE_RETRY_AFTER', 1)),
+        )
+
+    def _shed_response(self, reason, status):
+        with self._lock:
+            self._shed[reason] += 1
+        response = jsonify({'error': 'Server busy, please retry', 'reason': reason})
+        response.status_code = status
+        response.headers['Retry-After'] = str(self.retry_after)
+        return response
+
+    def _deadline(self, received_at):
+        value = request.headers.get(DEADLINE_HEADER)
+        if value is None:
+            return None
+        try:
+            return received_at + float(value) / 1000.0
+        except ValueError:
+            return None
+
+    def limit(self, view):
+        """Decorator that runs a view only once an inference slot is free."""
+
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method == 'OPTIONS':
+                return view(*args, **kwargs)
+
+            received_at = time.monotonic()
+            deadline = self._deadline(received_at)
+            if deadline is not None and deadline <= received_at:
+                return self._shed_response('deadline_expired', 504)
+
+            with self._lock:
+                if self._pending >= self.max_concurrency + self.max_queue:
+                    full = True
+                else:
+                    full = False
+                    self._pending += 1
+            if full:
+                return self._shed_response('queue_full', 503)
+
+            try:
+                timeout = self.queue_timeout
+                if deadline is not None:
+                    timeout = min(timeout, deadline - received_at)
+                if not self._slots.acquire(timeout=max(timeout, 0)):
+                    if deadline is not None and time.monotonic() >= deadline:
+                        return self._shed_response('deadline_expired', 504)
+                    return self._shed_response('queue_timeout', 503)
+
+                try:
+                    # The deadline may have passed while we waited for the slot.
+                    if deadline is not None and time.monotonic() >= deadline:
+                        return self._shed_response('deadline_expired', 504)
+                    with self._lock:
+                        self._in_flight += 1
+                        self._admitted += 1
+                    try:
+                        return view(*args, **kwargs)
+                    finally:
+                        with self._lock:
+                            self._in_flight -= 1
+                finally:
+                    self._slots.release()
+            finally:
+                with self._lock:
+                    self._pending -= 1
+
+        return wrapper
+
+    def metrics(self):
+        with self._lock:
+            return {
+                'queue_depth': self._pending - self._in_flight,
+                'in_flight': self._in_flight,
+                'max_concurrency': self.max_concurrency,
+                'max_queue': self.max_queue,
+                'admitted': self._admitted,
+                'shed': dict(self._shed),
+                'shed_total': sum(self._shed.values()),
+            }
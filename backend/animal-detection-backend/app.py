@@ -7,6 +7,7 @@ import os
 import traceback
 from flask_cors import CORS
 from pymongo import MongoClient
+from admission import AdmissionController
 
 app = Flask(__name__)
 CORS(app, resources={r"/*": {"origins": "*"}})
@@ -61,7 +62,11 @@ transform = transforms.Compose([
     transforms.Normalize(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225]),
 ])
 
+# Bounded inference queue; limits are configurable through INFERENCE_* env vars
+admission = AdmissionController.from_env()
+
 @app.route('/predict', methods=['POST', 'OPTIONS'])
+@admission.limit
 def predict():
     if request.method == 'OPTIONS':
         return jsonify({'success': True}), 200
@@ -107,6 +112,10 @@ def get_animal_details(animal_name):
         print(f"Error fetching animal details: {e}")
         return jsonify({"error": "Database error"}), 500
 
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    return jsonify(admission.metrics()), 200
+
 @app.route('/', methods=['GET'])
 def health_check():
     return jsonify({'message': 'Server running'}), 200
@@ -7,6 +7,7 @@ import numpy as np
 import tensorflow as tf
 import os
 import logging
+from admission import AdmissionController
 
 app = Flask(__name__)
 
@@ -19,13 +20,21 @@ logging.debug("Loading model from: %s", MODEL_PATH)
 model = tf.keras.models.load_model(MODEL_PATH)
 logging.debug("Model loaded successfully.")
 
+# Bounded inference queue; limits are configurable through INFERENCE_* env vars
+admission = AdmissionController.from_env()
+
 labels = ["cat", "dog", "bird", "fish", "elephant", "lion", "giraffe", "rabbit", "cow", "tiger"]
 
 @app.route('/')
 def index():
     return "Welcome to the Smart Drawing API! Use POST /predict to classify images."
 
+@app.route('/metrics')
+def metrics():
+    return jsonify(admission.metrics())
+
 @app.route('/predict', methods=['POST'])
+@admission.limit
 def predict_drawing():
     # Ensure the request has a file.
     if 'image' not in request.files: